@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from collections import deque
 from typing import TypeAlias
 
 from homeassistant.config_entries import ConfigEntry
@@ -73,8 +74,6 @@ async def _async_options_updated(
     # Resize MQTT message buffer if changed
     new_size = entry.options.get(CONF_MQTT_BUFFER_SIZE, DIAG_MAX_MESSAGES)
     if coordinator.mqtt_message_buffer.maxlen != new_size:
-        from collections import deque
-
         old_messages = list(coordinator.mqtt_message_buffer)
         coordinator.mqtt_message_buffer = deque(old_messages, maxlen=new_size)
 
@@ -9,6 +9,7 @@ import logging
 import secrets
 from typing import Any
 
+import aiohttp
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry, ConfigFlow, ConfigFlowResult, OptionsFlow
@@ -145,8 +146,6 @@ async def _get_basic_data(
     hass: HomeAssistant, access_token: str, vin: str
 ) -> dict[str, Any]:
     """Get basic vehicle data to validate VIN access."""
-    import aiohttp
-
     try:
         data = await async_bmw_api_get(
             hass, access_token, f"/customers/vehicles/{vin}/basicData"
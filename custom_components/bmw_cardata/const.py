@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import Final, NamedTuple
 
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
-from homeassistant.components.sensor import SensorDeviceClass
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
 from homeassistant.const import PERCENTAGE, UnitOfEnergy, UnitOfLength, UnitOfPressure
 
 
@@ -17,6 +17,7 @@ class SensorDef(NamedTuple):
     device_class: SensorDeviceClass | None
     icon: str | None
     drivetrain: str | None
+    state_class: SensorStateClass = SensorStateClass.MEASUREMENT
 
 
 class BinarySensorDef(NamedTuple):
@@ -68,7 +69,11 @@ TOKEN_ENDPOINT: Final = f"{AUTH_BASE_URL}/gcdm/oauth/token"
 MQTT_BROKER_HOST: Final = "customer.streaming-cardata.bmwgroup.com"
 MQTT_BROKER_PORT: Final = 9000
 MQTT_KEEPALIVE: Final = 60
+# QoS 0: clean sessions don't queue QoS 1 messages across reconnects anyway, and
+# BMW re-sends current state on connect, so PUBACK round-trips buy nothing
+MQTT_QOS: Final = 0
 MQTT_TOPIC_PATTERN: Final = "{gcid}/{vin}"
+MQTT_UPDATE_COALESCE_DELAY: Final = 0.1  # Seconds to batch message bursts into one entity update
 
 # OAuth settings
 DEFAULT_SCOPES: Final = "authenticate_user openid cardata:streaming:read cardata:api:read"
@@ -93,20 +98,25 @@ DRIVETRAIN_BEV: Final = "BEV"    # Battery electric vehicle
 LOCATION_LATITUDE_KEY: Final = "vehicle.cabin.infotainment.navigation.currentLocation.latitude"
 LOCATION_LONGITUDE_KEY: Final = "vehicle.cabin.infotainment.navigation.currentLocation.longitude"
 LOCATION_ALTITUDE_KEY: Final = "vehicle.cabin.infotainment.navigation.currentLocation.altitude"
+LOCATION_MIN_WRITE_INTERVAL: Final = 2.0  # Seconds between device tracker state writes
 
 # Drivetrain filter values for entity definitions
 # None = all drivetrains, "electric" = PHEV/BEV only, "combustion" = CONV/PHEV only
 DRIVETRAIN_ELECTRIC: Final = "electric"
 DRIVETRAIN_COMBUSTION: Final = "combustion"
 
+# Odometer key; its value is reported as an integer
+ODOMETER_KEY: Final = "vehicle.vehicle.travelledDistance"
+
 # Known sensor keys with metadata
 KNOWN_SENSORS: Final[dict[str, SensorDef]] = {
-    "vehicle.vehicle.travelledDistance": SensorDef(
+    ODOMETER_KEY: SensorDef(
         name="Odometer",
         unit=UnitOfLength.KILOMETERS,
         device_class=SensorDeviceClass.DISTANCE,
         icon="mdi:counter",
         drivetrain=None,
+        state_class=SensorStateClass.TOTAL_INCREASING,
     ),
     "vehicle.drivetrain.lastRemainingRange": SensorDef(
         name="Total Range",
@@ -170,6 +180,8 @@ KNOWN_SENSORS: Final[dict[str, SensorDef]] = {
         device_class=SensorDeviceClass.ENERGY,
         icon="mdi:battery-charging",
         drivetrain=DRIVETRAIN_ELECTRIC,
+        # Energy delta is a total value, not a point-in-time measurement
+        state_class=SensorStateClass.TOTAL,
     ),
 }
 
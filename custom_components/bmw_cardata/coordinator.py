@@ -4,12 +4,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import sys
 from collections import deque
 from datetime import datetime, timezone
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import (
@@ -22,6 +24,7 @@ from .const import (
     DRIVETRAIN_BEV,
     DRIVETRAIN_CONV,
     EVENT_MQTT_DEBUG,
+    MQTT_UPDATE_COALESCE_DELAY,
     TOKEN_ACCESS,
 )
 from .mqtt_manager import BMWMqttManager
@@ -52,10 +55,22 @@ class BMWCarDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         )
         self.config_entry = config_entry
         self._vin: str = config_entry.data[CONF_VIN]
+        self._vin_suffix = self._vin[-6:]  # Short VIN for log lines
         self._client_id: str = config_entry.data[CONF_CLIENT_ID]
         self._token_manager = token_manager
         self._mqtt_manager = mqtt_manager
 
+        # One DeviceInfo shared by every entity of this vehicle; vehicle info
+        # only changes via reauth/reconfigure, which reloads the entry
+        vehicle_info = self.vehicle_info
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, self._vin)},
+            name=f"{vehicle_info.get('brand', 'BMW')} {vehicle_info.get('model', self._vin[:8])}",
+            manufacturer=vehicle_info.get("brand", "BMW"),
+            model=vehicle_info.get("model"),
+            sw_version=vehicle_info.get("series"),
+        )
+
         # Initialize data store
         self.data: dict[str, Any] = {}
 
@@ -65,6 +80,12 @@ class BMWCarDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             maxlen=buffer_size
         )
 
+        # Pending coalesced entity update (see _async_process_mqtt_data)
+        self._pending_flush: asyncio.TimerHandle | None = None
+        # Entity callbacks per telemetry key, and keys changed since last flush
+        self._key_listeners: dict[str, list[CALLBACK_TYPE]] = {}
+        self._dirty_keys: set[str] = set()
+
     @property
     def vin(self) -> str:
         """Return the VIN."""
@@ -99,7 +120,7 @@ class BMWCarDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Fetch initial data via REST API."""
         access_token = await self.async_get_access_token()
         if not access_token:
-            _LOGGER.warning("[%s] No access token for initial data fetch", self._vin[-6:])
+            _LOGGER.warning("[%s] No access token for initial data fetch", self._vin_suffix)
             return {}
 
         data: dict[str, Any] = {}
@@ -110,50 +131,67 @@ class BMWCarDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 f"/customers/vehicles/{self._vin}/basicData",
             )
             data["basic_data"] = basic_data
-            _LOGGER.debug("[%s] Fetched basic vehicle data", self._vin[-6:])
+            _LOGGER.debug("[%s] Fetched basic vehicle data", self._vin_suffix)
 
         except asyncio.TimeoutError:
-            _LOGGER.warning("[%s] Timeout fetching initial data", self._vin[-6:])
+            _LOGGER.warning("[%s] Timeout fetching initial data", self._vin_suffix)
         except Exception as err:
-            _LOGGER.warning("[%s] Error fetching initial data: %s", self._vin[-6:], err)
+            _LOGGER.warning("[%s] Error fetching initial data: %s", self._vin_suffix, err)
 
         return data
 
     async def async_setup(self) -> bool:
         """Set up the coordinator."""
-        # Fetch initial data
-        initial_data = await self._async_fetch_initial_data()
-        self.data.update(initial_data)
-
         # Register with shared MQTT manager
-        self._mqtt_manager.register_vin(self._vin, self._handle_mqtt_message)
-        
-        # Start MQTT if not already running
-        await self._mqtt_manager.async_start()
+        self._mqtt_manager.register_vin(
+            self._vin, self._handle_mqtt_message, self._async_connection_changed
+        )
+
+        # Fetch initial REST data while MQTT connects (if not already running);
+        # setup waits for the slower of the two rather than their sum
+        initial_data, _ = await asyncio.gather(
+            self._async_fetch_initial_data(),
+            self._mqtt_manager.async_start(),
+        )
+        self.data.update(initial_data)
 
         return True
 
     async def async_shutdown(self) -> None:
         """Shut down the coordinator."""
+        if self._pending_flush is not None:
+            self._pending_flush.cancel()
+            self._pending_flush = None
+
         # Unregister from MQTT manager (manager handles connection lifecycle)
         self._mqtt_manager.unregister_vin(self._vin)
 
+    @callback
+    def _async_connection_changed(self) -> None:
+        """Refresh every entity when the MQTT connection state changes.
+
+        Availability depends on the connection, so this goes through the
+        generic coordinator listeners instead of the per-key routing.
+        """
+        self.async_update_listeners()
+
+    @callback
     def _handle_mqtt_message(self, payload: dict[str, Any]) -> None:
-        """Handle MQTT message routed from the shared manager."""
+        """Handle MQTT message routed from the shared manager (on the event loop)."""
         # Log summary
-        data_keys = list(payload.get("data", {}).keys())
         _LOGGER.debug(
             "[%s] MQTT message: %d telemetry keys",
-            self._vin[-6:],
-            len(data_keys),
+            self._vin_suffix,
+            len(payload.get("data", {})),
         )
-        
-        # Schedule processing on event loop (we might be called from callback)
-        self.hass.async_create_task(self._async_process_mqtt_data(payload))
 
-    async def _async_process_mqtt_data(self, payload: dict[str, Any]) -> None:
+        self._async_process_mqtt_data(payload)
+
+    @callback
+    def _async_process_mqtt_data(self, payload: dict[str, Any]) -> None:
         """Process MQTT data and update entities."""
         updated = False
+        received_at: str | None = None  # Arrival time, shared by the whole payload
 
         # Fire debug event if enabled in options
         if self.config_entry.options.get(CONF_MQTT_DEBUG, False):
@@ -176,18 +214,78 @@ class BMWCarDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         
         for key, value_obj in data_payload.items():
             actual_value, timestamp = extract_telemetry_value(value_obj)
+
+            # Skip samples we already hold (BMW re-sends the full state on
+            # reconnect); without a source timestamp, same value means no news
+            existing = self.data.get(key)
+            if (
+                existing is not None
+                and existing["value"] == actual_value
+                and (timestamp is None or timestamp == existing["timestamp"])
+            ):
+                continue
+
             if timestamp is None:
-                timestamp = datetime.now(tz=timezone.utc).isoformat()
-            
+                if received_at is None:
+                    received_at = datetime.now(tz=timezone.utc).isoformat()
+                timestamp = received_at
+
+            # Intern new keys so entity lookups (made with the interned const
+            # strings) compare by identity instead of char-by-char
+            if existing is None:
+                key = sys.intern(key)
+
             # Store the value in normalised format
             self.data[key] = {
                 "value": actual_value,
                 "timestamp": timestamp,
             }
+            self._dirty_keys.add(key)
             updated = True
 
-        if updated:
-            self.async_set_updated_data(self.data)
+        # BMW often splits related keys (e.g. lat/lon/alt) across messages
+        # milliseconds apart; coalesce them into a single entity update
+        if updated and self._pending_flush is None:
+            self._pending_flush = self.hass.loop.call_later(
+                MQTT_UPDATE_COALESCE_DELAY, self._async_flush_updates
+            )
+
+    @callback
+    def async_add_key_listener(
+        self, key: str, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for changes to a single telemetry key.
+
+        Returns a function that removes the listener.
+        """
+        listeners = self._key_listeners.setdefault(key, [])
+        listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the key listener."""
+            listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _async_flush_updates(self) -> None:
+        """Push coalesced telemetry changes to the entities that use them.
+
+        Updates are routed per key instead of through async_set_updated_data,
+        which would wake every entity of the vehicle for any change.
+        """
+        self._pending_flush = None
+        dirty_keys, self._dirty_keys = self._dirty_keys, set()
+
+        # Dict keeps order and runs an entity listening on several keys once
+        callbacks = {
+            update_callback: None
+            for key in dirty_keys
+            for update_callback in self._key_listeners.get(key, ())
+        }
+        for update_callback in callbacks:
+            update_callback()
 
     @property
     def is_mqtt_connected(self) -> bool:
@@ -2,26 +2,39 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import sys
+from typing import Any
 
 from homeassistant.components.device_tracker import SourceType
 from homeassistant.components.device_tracker.config_entry import TrackerEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
     LOCATION_ALTITUDE_KEY,
     LOCATION_LATITUDE_KEY,
     LOCATION_LONGITUDE_KEY,
+    LOCATION_MIN_WRITE_INTERVAL,
 )
 from .coordinator import BMWCarDataCoordinator
 from .entity import BMWCarDataEntity
-from .utils import extract_telemetry_value
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _record_float(record: dict[str, Any] | None) -> float | None:
+    """Return a telemetry record's value as a float, or None if absent/non-numeric."""
+    if record is None:
+        return None
+    try:
+        return float(record["value"])
+    except (TypeError, ValueError):
+        return None
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -40,8 +53,25 @@ class BMWCarDataDeviceTracker(BMWCarDataEntity, TrackerEntity):
     and shows the vehicle on the Home Assistant map.
     """
 
+    __slots__ = (
+        "_last_latitude",
+        "_last_longitude",
+        "_last_altitude",
+        "_attrs",
+        "_last_write",
+        "_pending_write",
+    )
+
     _attr_icon = "mdi:car"
 
+    # Telemetry key -> cached attribute, walked once per coordinator update;
+    # keys interned to match the coordinator's data keys by identity
+    _LOCATION_KEY_ATTRS: tuple[tuple[str, str], ...] = (
+        (sys.intern(LOCATION_LATITUDE_KEY), "_last_latitude"),
+        (sys.intern(LOCATION_LONGITUDE_KEY), "_last_longitude"),
+        (sys.intern(LOCATION_ALTITUDE_KEY), "_last_altitude"),
+    )
+
     def __init__(self, coordinator: BMWCarDataCoordinator) -> None:
         """Initialize the device tracker."""
         super().__init__(
@@ -56,10 +86,20 @@ class BMWCarDataDeviceTracker(BMWCarDataEntity, TrackerEntity):
         self._last_longitude: float | None = None
         self._last_altitude: float | None = None
         self._last_timestamp: str | None = None
+        # Extra state attributes, rebuilt only when altitude/timestamp change
+        self._attrs: dict[str, float | str | None] = {}
+        # Loop time of the last state write, and the scheduled trailing write
+        self._last_write = 0.0
+        self._pending_write: asyncio.TimerHandle | None = None
 
     async def async_added_to_hass(self) -> None:
-        """Restore state when entity is added to hass."""
+        """Cancel any pending write when the entity is removed."""
         await super().async_added_to_hass()
+        self.async_on_remove(self._async_cancel_pending_write)
+
+    async def _async_restore_state(self) -> None:
+        """Restore the last known location saved before the restart."""
+        await super()._async_restore_state()
 
         # Try to restore previous state (for device_tracker, state is the zone name)
         if (last_state := await self.async_get_last_state()) is not None:
@@ -73,35 +113,88 @@ class BMWCarDataDeviceTracker(BMWCarDataEntity, TrackerEntity):
                 if self._last_latitude is not None and self._last_longitude is not None:
                     self._has_received_data = True
 
-    def _process_coordinator_data(self) -> None:
-        """Extract location values from coordinator data."""
-        def _extract(key: str) -> float | None:
-            data = self.coordinator.data.get(key)
-            if data is None:
-                return None
-            value, _ = extract_telemetry_value(data)
-            return float(value) if isinstance(value, (int, float)) else None
-
-        lat = _extract(LOCATION_LATITUDE_KEY)
-        lon = _extract(LOCATION_LONGITUDE_KEY)
-        alt = _extract(LOCATION_ALTITUDE_KEY)
-
-        if lat is not None:
-            self._last_latitude = lat
-        if lon is not None:
-            self._last_longitude = lon
-        if alt is not None:
-            self._last_altitude = alt
+                self._update_attrs()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated location data, writing state at most every few seconds.
+
+        High-cadence GPS updates are conflated: a change arriving too soon after
+        the last write schedules one trailing write, which picks up whatever
+        position is cached by then, so the final position is never dropped.
+        """
+        changed = self._process_coordinator_data() or self._availability_changed()
+        if not changed or self._pending_write is not None:
+            return
+
+        delay = self._last_write + LOCATION_MIN_WRITE_INTERVAL - self.hass.loop.time()
+        if delay > 0:
+            self._pending_write = self.hass.loop.call_later(
+                delay, self._async_write_location
+            )
+            return
+
+        self._async_write_location()
+
+    @callback
+    def _async_write_location(self) -> None:
+        """Write the cached location to the state machine."""
+        self._pending_write = None
+        self._last_write = self.hass.loop.time()
+        self._async_write_state()
+
+    @callback
+    def _async_cancel_pending_write(self) -> None:
+        """Cancel a scheduled trailing write."""
+        if self._pending_write is not None:
+            self._pending_write.cancel()
+            self._pending_write = None
+
+    def _telemetry_keys(self) -> tuple[str, ...]:
+        """Return the telemetry keys this entity is updated from."""
+        return tuple(key for key, _ in self._LOCATION_KEY_ATTRS)
+
+    def _process_coordinator_data(self) -> bool:
+        """Extract location values from coordinator data.
+
+        Location keys only arrive via MQTT, which the coordinator always stores
+        as normalised ``{"value": ..., "timestamp": ...}`` records.
+
+        Returns True if any cached location value or the timestamp changed.
+        """
+        previous_lat_lon = (self._last_latitude, self._last_longitude)
+        previous_attrs = (self._last_altitude, self._last_timestamp)
+
+        data = self.coordinator.data
+        for key, attr in self._LOCATION_KEY_ATTRS:
+            if (value := _record_float(data.get(key))) is not None:
+                setattr(self, attr, value)
 
         if self._last_latitude is not None and self._last_longitude is not None:
             self._has_received_data = True
 
         # Update timestamp from latitude key
-        lat_data = self.coordinator.data.get(LOCATION_LATITUDE_KEY)
-        if lat_data is not None:
-            _, ts = extract_telemetry_value(lat_data)
-            if ts:
-                self._last_timestamp = ts
+        lat_record = data.get(LOCATION_LATITUDE_KEY)
+        if lat_record is not None and lat_record["timestamp"]:
+            self._last_timestamp = lat_record["timestamp"]
+
+        attrs_changed = (self._last_altitude, self._last_timestamp) != previous_attrs
+        if attrs_changed:
+            self._update_attrs()
+
+        return (
+            attrs_changed
+            or (self._last_latitude, self._last_longitude) != previous_lat_lon
+        )
+
+    def _update_attrs(self) -> None:
+        """Rebuild the cached extra state attributes."""
+        attrs: dict[str, float | str | None] = {}
+        if self._last_altitude is not None:
+            attrs["altitude"] = self._last_altitude
+        if self._last_timestamp:
+            attrs["last_changed"] = self._last_timestamp
+        self._attrs = attrs
 
     @property
     def available(self) -> bool:
@@ -127,9 +220,4 @@ class BMWCarDataDeviceTracker(BMWCarDataEntity, TrackerEntity):
     @property
     def extra_state_attributes(self) -> dict[str, float | str | None]:
         """Return extra state attributes."""
-        attrs: dict[str, float | str | None] = {}
-        if self._last_altitude is not None:
-            attrs["altitude"] = self._last_altitude
-        if self._last_timestamp:
-            attrs["last_changed"] = self._last_timestamp
-        return attrs
+        return self._attrs
@@ -2,19 +2,29 @@
 
 from __future__ import annotations
 
+import sys
+
 from homeassistant.core import callback
-from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.restore_state import RestoredExtraData, RestoreEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION, DOMAIN
+from .const import ATTRIBUTION
 from .coordinator import BMWCarDataCoordinator
-from .utils import extract_telemetry_value
 
 
 class BMWCarDataEntity(CoordinatorEntity[BMWCarDataCoordinator], RestoreEntity):
     """Base class for BMW CarData entities."""
 
+    # HA's Entity bases still provide a __dict__; slots keep the per-update
+    # caches read on every state access out of it
+    __slots__ = (
+        "_key",
+        "_last_value",
+        "_last_timestamp",
+        "_has_received_data",
+        "_written_available",
+    )
+
     _attr_has_entity_name = True
 
     def __init__(
@@ -25,20 +35,51 @@ class BMWCarDataEntity(CoordinatorEntity[BMWCarDataCoordinator], RestoreEntity):
     ) -> None:
         """Initialize the entity."""
         super().__init__(coordinator)
-        self._key = key
+        self._key = sys.intern(key)
         self._attr_name = name
         self._attr_unique_id = f"{coordinator.vin}_{key}"
+        self._attr_device_info = coordinator.device_info
         # Cache the last known value to retain when key is not in update
         self._last_value = None
         self._last_timestamp: str | None = None
         self._has_received_data = False
+        # Availability as of the last state write; it can change (MQTT
+        # connect/disconnect) without this entity's data changing
+        self._written_available: bool | None = None
 
     async def async_added_to_hass(self) -> None:
         """Restore state when entity is added to hass."""
         await super().async_added_to_hass()
-        
-        # Try to restore previous state
-        if (last_state := await self.async_get_last_state()) is not None:
+        await self._async_restore_state()
+
+        # The coordinator routes MQTT updates per telemetry key, so subscribe
+        # only to ours; CoordinatorEntity's generic listener fires only on
+        # MQTT connection changes
+        for key in self._telemetry_keys():
+            self.async_on_remove(
+                self.coordinator.async_add_key_listener(
+                    key, self._handle_coordinator_update
+                )
+            )
+
+        # Process any data already in coordinator; runs after the restore so
+        # a fix MQTT delivered before this entity was added wins over it
+        self._process_coordinator_data()
+        # The platform writes the initial state right after this returns
+        self._written_available = self.available
+
+    async def _async_restore_state(self) -> None:
+        """Restore values saved before the last restart. Extend in subclasses."""
+        # Prefer the typed value saved in extra data; no string re-parsing
+        if (extra_data := await self.async_get_last_extra_data()) is not None:
+            restored = extra_data.as_dict()
+            self._last_value = restored.get("value")
+            self._last_timestamp = restored.get("timestamp")
+            if self._last_value is not None:
+                self._has_received_data = True
+
+        # Fall back to the state string for entities saved before extra data
+        elif (last_state := await self.async_get_last_state()) is not None:
             # Restore the value based on entity type
             if last_state.state not in (None, "unknown", "unavailable"):
                 self._restore_native_value(last_state.state)
@@ -47,9 +88,10 @@ class BMWCarDataEntity(CoordinatorEntity[BMWCarDataCoordinator], RestoreEntity):
             # Restore timestamp from attributes
             if last_state.attributes:
                 self._last_timestamp = last_state.attributes.get("last_changed")
-        
-        # Process any data already in coordinator
-        self._process_coordinator_data()
+
+    def _telemetry_keys(self) -> tuple[str, ...]:
+        """Return the telemetry keys this entity is updated from."""
+        return (self._key,)
 
     def _restore_native_value(self, state: str) -> None:
         """Restore the native value from state string. Override in subclasses."""
@@ -58,26 +100,42 @@ class BMWCarDataEntity(CoordinatorEntity[BMWCarDataCoordinator], RestoreEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self._process_coordinator_data()
+        # Coordinator updates fan out to every entity; only write state
+        # when this entity's own data or its availability actually changed
+        if self._process_coordinator_data() or self._availability_changed():
+            self._async_write_state()
+
+    def _availability_changed(self) -> bool:
+        """Return True if availability differs from the last written state."""
+        return self.available != self._written_available
+
+    @callback
+    def _async_write_state(self) -> None:
+        """Write state, remembering the availability that was written."""
+        self._written_available = self.available
         self.async_write_ha_state()
 
-    def _process_coordinator_data(self) -> None:
-        """Process and cache data from coordinator. Called once per update."""
-        data = self.coordinator.data.get(self._key)
-        if data is not None:
-            self._last_value, self._last_timestamp = extract_telemetry_value(data)
-            self._has_received_data = True
+    def _process_coordinator_data(self) -> bool:
+        """Process and cache data from coordinator. Called once per update.
+
+        Returns True if the cached value or timestamp changed.
+        """
+        # Telemetry is normalised to {"value", "timestamp"} records at ingest
+        record = self.coordinator.data.get(self._key)
+        if record is None:
+            return False
+
+        previous = (self._last_value, self._last_timestamp)
+        self._last_value = record["value"]
+        self._last_timestamp = record["timestamp"]
+        self._has_received_data = True
+        return (self._last_value, self._last_timestamp) != previous
 
     @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        vehicle_info = self.coordinator.vehicle_info
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.vin)},
-            name=f"{vehicle_info.get('brand', 'BMW')} {vehicle_info.get('model', self.coordinator.vin[:8])}",
-            manufacturer=vehicle_info.get("brand", "BMW"),
-            model=vehicle_info.get("model"),
-            sw_version=vehicle_info.get("series"),
+    def extra_restore_state_data(self) -> RestoredExtraData:
+        """Return the typed value and timestamp to persist across restarts."""
+        return RestoredExtraData(
+            {"value": self._last_value, "timestamp": self._last_timestamp}
         )
 
     @property
@@ -3,21 +3,22 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
-import ssl
 import threading
 from typing import Any, Callable
 
 import paho.mqtt.client as mqtt
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.json import json_loads
+from homeassistant.util.ssl import get_default_context
 
 from .const import (
     DOMAIN,
     MQTT_BROKER_HOST,
     MQTT_BROKER_PORT,
     MQTT_KEEPALIVE,
+    MQTT_QOS,
     MQTT_TOPIC_PATTERN,
     TOKEN_ID,
 )
@@ -41,17 +42,22 @@ class BMWMqttManager:
         self.hass = hass
         self._token_manager = token_manager
         self._gcid = gcid
+        self._gcid_prefix = gcid[:8]  # Short GCID for log lines
+        self._client_id = f"ha-bmw-cardata-{self._gcid_prefix}"
         self._mqtt_client: mqtt.Client | None = None
         self._mqtt_connected = False
         self._mqtt_connecting = False  # Track if connection attempt is in progress
         self._stopped = False  # Set on async_stop(); causes reconnect loop to exit cleanly
         self._intentional_disconnect = False  # Suppress reconnect from intentional teardown
-        self._mqtt_lock = threading.Lock()
         self._start_lock = asyncio.Lock()
+        self._client_lock = asyncio.Lock()  # Serializes paho client creation/teardown
         self._reconnect_lock = asyncio.Lock()
-        # Map VIN -> callback function for message routing.
-        # Protected by _vin_lock (accessed from both HA loop and paho thread).
+        # Map VIN -> callback function for message routing (event loop only).
+        # Topics and subscription state are shared with paho's thread and
+        # protected by _vin_lock.
         self._vin_callbacks: dict[str, Callable[[dict[str, Any]], None]] = {}
+        self._vin_connection_callbacks: dict[str, Callable[[], None]] = {}
+        self._vin_topics: dict[str, str] = {}  # VIN -> topic, formatted once at register
         self._subscribed_vins: set[str] = set()
         self._vin_lock = threading.Lock()
 
@@ -60,31 +66,53 @@ class BMWMqttManager:
         """Return True if MQTT is connected."""
         return self._mqtt_connected
 
+    def _set_connected(self, connected: bool) -> None:
+        """Update the connection state and notify coordinators if it changed.
+
+        Called from paho's network thread as well as the event loop.
+        """
+        if self._mqtt_connected == connected:
+            return
+        self._mqtt_connected = connected
+        self.hass.loop.call_soon_threadsafe(self._async_notify_connection_change)
+
+    @callback
+    def _async_notify_connection_change(self) -> None:
+        """Tell every registered coordinator that the connection state changed."""
+        for connection_callback in list(self._vin_connection_callbacks.values()):
+            connection_callback()
+
     def register_vin(
-        self, vin: str, callback: Callable[[dict[str, Any]], None]
+        self,
+        vin: str,
+        callback: Callable[[dict[str, Any]], None],
+        connection_callback: Callable[[], None],
     ) -> None:
-        """Register a VIN with its message callback."""
+        """Register a VIN with its message and connection-change callbacks."""
         with self._vin_lock:
             self._vin_callbacks[vin] = callback
+            self._vin_connection_callbacks[vin] = connection_callback
+            topic = MQTT_TOPIC_PATTERN.format(gcid=self._gcid, vin=vin)
+            self._vin_topics[vin] = topic
         
             # If already connected, subscribe to this VIN's topic
             if self._mqtt_connected and self._mqtt_client and vin not in self._subscribed_vins:
-                topic = MQTT_TOPIC_PATTERN.format(gcid=self._gcid, vin=vin)
-                self._mqtt_client.subscribe(topic, qos=1)
+                self._mqtt_client.subscribe(topic, qos=MQTT_QOS)
                 self._subscribed_vins.add(vin)
-                _LOGGER.info("[%s] Subscribed to topic for VIN %s", self._gcid[:8], vin[-6:])
+                _LOGGER.info("[%s] Subscribed to topic for VIN %s", self._gcid_prefix, vin[-6:])
 
     def unregister_vin(self, vin: str) -> bool:
         """Unregister a VIN. Returns True if no more VINs registered."""
         with self._vin_lock:
             self._vin_callbacks.pop(vin, None)
+            self._vin_connection_callbacks.pop(vin, None)
+            topic = self._vin_topics.pop(vin, None)
         
             # Unsubscribe from topic if connected
-            if self._mqtt_connected and self._mqtt_client and vin in self._subscribed_vins:
-                topic = MQTT_TOPIC_PATTERN.format(gcid=self._gcid, vin=vin)
+            if self._mqtt_connected and self._mqtt_client and topic and vin in self._subscribed_vins:
                 self._mqtt_client.unsubscribe(topic)
                 self._subscribed_vins.discard(vin)
-                _LOGGER.info("[%s] Unsubscribed from topic for VIN %s", self._gcid[:8], vin[-6:])
+                _LOGGER.info("[%s] Unsubscribed from topic for VIN %s", self._gcid_prefix, vin[-6:])
         
             return len(self._vin_callbacks) == 0
 
@@ -97,7 +125,7 @@ class BMWMqttManager:
             
             # If we have a dead client, clean it up first
             if self._mqtt_client and not self._mqtt_connected and not self._mqtt_connecting:
-                _LOGGER.info("[%s] Cleaning up disconnected MQTT client", self._gcid[:8])
+                _LOGGER.info("[%s] Cleaning up disconnected MQTT client", self._gcid_prefix)
                 await self._async_stop_client()
             
             self._mqtt_connecting = True
@@ -107,14 +135,14 @@ class BMWMqttManager:
             # access token is still valid (e.g. right after a re-auth device-code
             # grant).  A failed refresh is not fatal — we fall back to the
             # existing id_token from a previous successful auth.
-            _LOGGER.debug("[%s] Forcing token refresh before MQTT connect", self._gcid[:8])
+            _LOGGER.debug("[%s] Forcing token refresh before MQTT connect", self._gcid_prefix)
             await self._token_manager.async_refresh_tokens(force=True)
 
             tokens = self._token_manager.tokens
             id_token = tokens.get(TOKEN_ID)
 
             if not id_token:
-                _LOGGER.error("[%s] Missing ID token for MQTT — re-authentication required", self._gcid[:8])
+                _LOGGER.error("[%s] Missing ID token for MQTT — re-authentication required", self._gcid_prefix)
                 self._mqtt_connecting = False
                 return
 
@@ -122,15 +150,15 @@ class BMWMqttManager:
                 """Create MQTT client and connect (runs in executor)."""
                 client = mqtt.Client(
                     callback_api_version=mqtt.CallbackAPIVersion.VERSION2,
-                    client_id=f"ha-bmw-cardata-{self._gcid[:8]}",
+                    client_id=self._client_id,
                     protocol=mqtt.MQTTv311,
                 )
 
                 client.username_pw_set(self._gcid, id_token)
 
-                # Use modern SSL context approach for better compatibility
-                ssl_context = ssl.create_default_context()
-                client.tls_set_context(ssl_context)
+                # Reuse HA's shared client SSL context instead of loading the
+                # CA bundle from disk again on every (re)connect
+                client.tls_set_context(get_default_context())
 
                 client.on_connect = self._on_mqtt_connect
                 client.on_disconnect = self._on_mqtt_disconnect
@@ -146,37 +174,50 @@ class BMWMqttManager:
                 return client
 
             try:
-                self._mqtt_client = await self.hass.async_add_executor_job(
-                    _create_and_connect
-                )
+                async with self._client_lock:
+                    # async_stop() may have run while we were refreshing tokens;
+                    # don't create a client (and paho thread) nobody will stop.
+                    if self._stopped:
+                        self._mqtt_connecting = False
+                        return
+                    self._mqtt_client = await self.hass.async_add_executor_job(
+                        _create_and_connect
+                    )
                 _LOGGER.info(
                     "[%s] MQTT client connecting to %s:%d",
-                    self._gcid[:8],
+                    self._gcid_prefix,
                     MQTT_BROKER_HOST,
                     MQTT_BROKER_PORT,
                 )
             except Exception as err:
                 self._mqtt_connecting = False
-                _LOGGER.error("[%s] Failed to create MQTT client: %s", self._gcid[:8], err)
+                _LOGGER.error("[%s] Failed to create MQTT client: %s", self._gcid_prefix, err)
 
     async def _async_stop_client(self) -> None:
         """Stop the MQTT client without affecting connecting state."""
-        if self._mqtt_client:
+        # Serialized on the event loop against client creation, so a stop
+        # issued mid-connect waits for the new client and tears it down.
+        async with self._client_lock:
+            if not self._mqtt_client:
+                return
+
             # Suppress _on_mqtt_disconnect from scheduling a reconnect —
             # this is an intentional teardown, not an unexpected broker drop.
             self._intentional_disconnect = True
 
+            # Detach the client on the event loop; the executor job only
+            # touches its own reference.
+            client = self._mqtt_client
+            self._mqtt_client = None
+
             def _stop():
-                with self._mqtt_lock:
-                    if self._mqtt_client:
-                        # disconnect() before loop_stop(): the network thread
-                        # must be running to transmit the DISCONNECT packet.
-                        self._mqtt_client.disconnect()
-                        self._mqtt_client.loop_stop()
+                # disconnect() before loop_stop(): the network thread
+                # must be running to transmit the DISCONNECT packet.
+                client.disconnect()
+                client.loop_stop()
 
             await self.hass.async_add_executor_job(_stop)
-            self._mqtt_client = None
-            self._mqtt_connected = False
+            self._set_connected(False)
             self._intentional_disconnect = False
             with self._vin_lock:
                 self._subscribed_vins.clear()
@@ -199,32 +240,34 @@ class BMWMqttManager:
         self._mqtt_connecting = False
         
         if reason_code == mqtt.CONNACK_ACCEPTED or reason_code.value == 0:
-            self._mqtt_connected = True
+            self._set_connected(True)
 
             # Snapshot VINs under lock, then subscribe outside lock
             # (paho subscribe is thread-safe and should not be called under our lock)
             with self._vin_lock:
                 self._subscribed_vins.clear()
-                vins_to_subscribe = list(self._vin_callbacks.keys())
+                vins_to_subscribe = list(self._vin_topics.items())
 
-            for vin in vins_to_subscribe:
-                topic = MQTT_TOPIC_PATTERN.format(gcid=self._gcid, vin=vin)
-                client.subscribe(topic, qos=1)
+            # One SUBSCRIBE packet carrying every VIN's topic filter
+            if vins_to_subscribe:
+                client.subscribe(
+                    [(topic, MQTT_QOS) for _, topic in vins_to_subscribe]
+                )
                 with self._vin_lock:
-                    self._subscribed_vins.add(vin)
+                    self._subscribed_vins.update(vin for vin, _ in vins_to_subscribe)
             
             _LOGGER.info(
                 "[%s] MQTT connected, subscribed to %d vehicle(s)",
-                self._gcid[:8],
+                self._gcid_prefix,
                 len(vins_to_subscribe),
             )
         else:
             _LOGGER.error(
                 "[%s] MQTT connection failed: %s",
-                self._gcid[:8],
+                self._gcid_prefix,
                 reason_code,
             )
-            self._mqtt_connected = False
+            self._set_connected(False)
 
             # Schedule reconnection attempt on auth failure
             if not self._stopped and not self._intentional_disconnect:
@@ -242,15 +285,15 @@ class BMWMqttManager:
         properties: mqtt.Properties | None = None,
     ) -> None:
         """Handle MQTT disconnection."""
-        self._mqtt_connected = False
+        self._set_connected(False)
         with self._vin_lock:
             self._subscribed_vins.clear()
 
         if self._stopped or self._intentional_disconnect:
-            _LOGGER.debug("[%s] MQTT disconnected (intentional): %s", self._gcid[:8], reason_code)
+            _LOGGER.debug("[%s] MQTT disconnected (intentional): %s", self._gcid_prefix, reason_code)
             return
 
-        _LOGGER.warning("[%s] MQTT disconnected: %s", self._gcid[:8], reason_code)
+        _LOGGER.warning("[%s] MQTT disconnected: %s", self._gcid_prefix, reason_code)
 
         # Schedule reconnection
         self.hass.loop.call_soon_threadsafe(
@@ -284,7 +327,7 @@ class BMWMqttManager:
 
                 _LOGGER.info(
                     "[%s] MQTT reconnect attempt %d/%d",
-                    self._gcid[:8],
+                    self._gcid_prefix,
                     attempt + 1,
                     len(delays),
                 )
@@ -303,14 +346,14 @@ class BMWMqttManager:
 
                 _LOGGER.warning(
                     "[%s] MQTT reconnect attempt %d failed, retrying in %ds",
-                    self._gcid[:8],
+                    self._gcid_prefix,
                     attempt + 1,
                     delays[attempt + 1] if attempt + 1 < len(delays) else 0,
                 )
 
             _LOGGER.error(
                 "[%s] MQTT reconnect exhausted all %d attempts",
-                self._gcid[:8],
+                self._gcid_prefix,
                 len(delays),
             )
 
@@ -322,7 +365,7 @@ class BMWMqttManager:
                     entry.async_start_reauth(self.hass)
                     _LOGGER.warning(
                         "[%s] Re-authentication required — check Home Assistant notifications",
-                        self._gcid[:8],
+                        self._gcid_prefix,
                     )
                     break
 
@@ -332,46 +375,46 @@ class BMWMqttManager:
         userdata: Any,
         message: mqtt.MQTTMessage,
     ) -> None:
-        """Handle incoming MQTT message and route to appropriate coordinator."""
+        """Hand an incoming MQTT message to the event loop.
+
+        Runs on paho's network thread, so it does no parsing: keeping this
+        thread on network I/O only keeps keepalives serviced during bursts.
+        """
+        self.hass.loop.call_soon_threadsafe(
+            self._async_route_message, message.topic, message.payload
+        )
+
+    @callback
+    def _async_route_message(self, topic: str, raw_payload: bytes) -> None:
+        """Parse an MQTT message and route it to the appropriate coordinator."""
         try:
-            payload_str = message.payload.decode("utf-8")
-            payload_data = json.loads(payload_str)
+            # orjson parses the raw bytes directly (no separate UTF-8 decode)
+            payload_data = json_loads(raw_payload)
 
             # Extract VIN from payload or topic
             vin = payload_data.get("vin")
             if not vin:
                 # Try to extract from topic: {gcid}/{vin}
-                topic_parts = message.topic.split("/")
+                topic_parts = topic.split("/")
                 if len(topic_parts) >= 2:
                     vin = topic_parts[1]
 
             if vin:
-                # Snapshot callback under lock (called from paho thread)
-                with self._vin_lock:
-                    callback = self._vin_callbacks.get(vin)
-                if callback is not None:
-                    # Schedule callback on HA event loop
-                    self.hass.loop.call_soon_threadsafe(
-                        self.hass.async_create_task,
-                        self._async_invoke_callback(callback, payload_data),
-                    )
+                # Callbacks are only modified on the event loop, so no lock needed
+                handler = self._vin_callbacks.get(vin)
+                if handler is not None:
+                    handler(payload_data)
                 else:
                     _LOGGER.debug(
                         "[%s] Received message for unknown VIN: %s",
-                        self._gcid[:8],
+                        self._gcid_prefix,
                         vin[-6:],
                     )
 
-        except (json.JSONDecodeError, UnicodeDecodeError) as err:
-            _LOGGER.warning("[%s] Failed to parse MQTT message: %s", self._gcid[:8], err)
+        except ValueError as err:  # orjson.JSONDecodeError, incl. invalid UTF-8
+            _LOGGER.warning("[%s] Failed to parse MQTT message: %s", self._gcid_prefix, err)
         except Exception as err:
-            _LOGGER.error("[%s] Error processing MQTT message: %s", self._gcid[:8], err)
-
-    async def _async_invoke_callback(
-        self, callback: Callable[[dict[str, Any]], None], payload: dict[str, Any]
-    ) -> None:
-        """Invoke callback with payload."""
-        callback(payload)
+            _LOGGER.error("[%s] Error processing MQTT message: %s", self._gcid_prefix, err)
 
 
 def get_mqtt_manager(
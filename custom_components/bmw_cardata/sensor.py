@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
+from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -18,12 +20,24 @@ from .const import (
     DRIVETRAIN_ELECTRIC,
     KNOWN_ENUM_SENSORS,
     KNOWN_SENSORS,
+    ODOMETER_KEY,
 )
 from .coordinator import BMWCarDataCoordinator
 from .entity import BMWCarDataEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+# Exact-type check for the numeric fast path (no isinstance subclass walk)
+_NUMERIC_TYPES: frozenset[type] = frozenset({int, float})
+
+
+def _parse_int(value: Any) -> int:
+    """Parse an integer value, tolerating a decimal string such as "1234.0".
+
+    Raises OverflowError for "inf" and out-of-range values.
+    """
+    return int(float(value))
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -34,7 +48,7 @@ async def async_setup_entry(
     coordinator: BMWCarDataCoordinator = entry.runtime_data
 
     # Create entities for all known sensors
-    entities: list[BMWCarDataSensor] = []
+    entities: list[BMWCarDataSensor | BMWCarDataEnumSensor] = []
 
     for key, sensor_def in KNOWN_SENSORS.items():
         # Skip electric-only sensors for conventional vehicles
@@ -53,19 +67,16 @@ async def async_setup_entry(
                 unit=sensor_def.unit,
                 device_class=sensor_def.device_class,
                 icon=sensor_def.icon,
+                state_class=sensor_def.state_class,
             )
         )
 
-    async_add_entities(entities)
-
     # Create enum sensors
-    enum_entities: list[BMWCarDataEnumSensor] = []
-
     for key, enum_def in KNOWN_ENUM_SENSORS.items():
         if not coordinator.is_electric and enum_def.drivetrain == DRIVETRAIN_ELECTRIC:
             continue
 
-        enum_entities.append(
+        entities.append(
             BMWCarDataEnumSensor(
                 coordinator=coordinator,
                 key=key,
@@ -77,13 +88,15 @@ async def async_setup_entry(
             )
         )
 
-    async_add_entities(enum_entities)
+    # Single batch so the platform does one registry/restore pass
+    async_add_entities(entities)
 
 
 class BMWCarDataSensor(BMWCarDataEntity, SensorEntity):
     """Representation of a BMW CarData sensor."""
 
-    _attr_state_class = SensorStateClass.MEASUREMENT
+    __slots__ = ("_cast",)
+
     _attr_suggested_display_precision = 0
 
     def __init__(
@@ -94,6 +107,7 @@ class BMWCarDataSensor(BMWCarDataEntity, SensorEntity):
         unit: str | None,
         device_class: SensorDeviceClass | None,
         icon: str | None,
+        state_class: SensorStateClass,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, key, name)
@@ -107,47 +121,43 @@ class BMWCarDataSensor(BMWCarDataEntity, SensorEntity):
         if icon:
             self._attr_icon = icon
 
-        # Odometer should be total_increasing
-        if "travelledDistance" in key:
-            self._attr_state_class = SensorStateClass.TOTAL_INCREASING
-
-        # Energy delta is a total value, not a point-in-time measurement
-        if device_class == SensorDeviceClass.ENERGY:
-            self._attr_state_class = SensorStateClass.TOTAL
+        self._attr_state_class = state_class
+        # Parser for non-numeric raw values; the odometer must stay an int
+        self._cast: Callable[[Any], float | int] = (
+            _parse_int if key == ODOMETER_KEY else float
+        )
 
     def _restore_native_value(self, state: str) -> None:
         """Restore the native value from state string."""
         try:
-            if "." in state:
-                self._last_value = float(state)
-            else:
-                self._last_value = int(state)
-        except (ValueError, TypeError):
+            self._last_value = self._cast(state)
+        except (ValueError, TypeError, OverflowError):
             self._last_value = None
 
     @property
     def native_value(self) -> float | int | None:
         """Return the sensor value."""
         value = self._last_value
-        if value is None:
+        # A bool is not a measurement (and would otherwise cast to 1.0/0.0)
+        if value is None or type(value) is bool:
             return None
 
         # Ensure numeric value
-        if isinstance(value, (int, float)):
+        if type(value) in _NUMERIC_TYPES:
             return value
 
         # Try to parse as number
         try:
-            if "." in str(value):
-                return float(value)
-            return int(value)
-        except (ValueError, TypeError):
+            return self._cast(value)
+        except (ValueError, TypeError, OverflowError):
             return None
 
 
 class BMWCarDataEnumSensor(BMWCarDataEntity, SensorEntity):
     """Representation of a BMW CarData enum sensor."""
 
+    __slots__ = ("_state_icons", "_default_icon")
+
     _attr_device_class = SensorDeviceClass.ENUM
 
     def __init__(
@@ -12,6 +12,7 @@ import aiohttp
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.json import json_loads
 
 from .const import (
     CONF_TOKENS,
@@ -137,9 +138,11 @@ class BMWTokenManager:
                             )
                             return False
 
-                        token_data = await response.json()
+                        token_data = await response.json(loads=json_loads)
 
-                        # Parse new tokens using shared utility
+                        # Parse new tokens using shared utility.  The token set is
+                        # swapped with a single assignment and never mutated in
+                        # place, so readers can't see old expiry with new tokens.
                         new_tokens = parse_token_response(token_data, self._tokens)
                         self._tokens = new_tokens
 
@@ -162,7 +165,8 @@ class BMWTokenManager:
 
     async def _async_update_all_entries(self, new_tokens: dict[str, Any]) -> None:
         """Update tokens in all config entries using this manager."""
-        for entry_id in list(self._config_entries):
+        # No await in the loop, so the set cannot change while we iterate
+        for entry_id in self._config_entries:
             entry = self.hass.config_entries.async_get_entry(entry_id)
             if entry:
                 new_data = {**entry.data, CONF_TOKENS: new_tokens}
@@ -9,6 +9,7 @@ from typing import Any
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.json import json_loads
 
 from .const import (
     API_BASE_URL,
@@ -45,18 +46,19 @@ def parse_token_response(
 
     expires_in = token_data.get("expires_in", 3600)
     refresh_expires_in = token_data.get("refresh_expires_in", 1209600)  # 2 weeks default
+    now = int(time.time())  # One clock read so all three fields agree
 
     return {
         TOKEN_ACCESS: token_data.get("access_token"),
         TOKEN_REFRESH: token_data.get("refresh_token") or existing.get(TOKEN_REFRESH),
         TOKEN_ID: token_data.get("id_token") or existing.get(TOKEN_ID),
         TOKEN_GCID: gcid,
-        TOKEN_EXPIRES_AT: int(time.time()) + expires_in,
+        TOKEN_EXPIRES_AT: now + expires_in,
         # Preserve existing refresh expiry if present (refresh doesn't reset it)
         TOKEN_REFRESH_EXPIRES_AT: existing.get(
-            TOKEN_REFRESH_EXPIRES_AT, int(time.time()) + refresh_expires_in
+            TOKEN_REFRESH_EXPIRES_AT, now + refresh_expires_in
         ),
-        TOKEN_UPDATED_AT: int(time.time()),
+        TOKEN_UPDATED_AT: now,
     }
 
 
@@ -72,7 +74,8 @@ def format_token_expiry(expires_at: int) -> str:
         return f"{remaining}s"
     if remaining < 3600:
         return f"{remaining // 60}m"
-    return f"{remaining // 3600}h {(remaining % 3600) // 60}m"
+    hours, rest = divmod(remaining, 3600)
+    return f"{hours}h {rest // 60}m"
 
 
 async def async_bmw_api_get(
@@ -101,7 +104,8 @@ async def async_bmw_api_get(
             },
         ) as response:
             response.raise_for_status()
-            return await response.json()
+            # orjson-backed parser; basicData is a sizeable nested document
+            return await response.json(loads=json_loads)
 
 
 def extract_telemetry_value(data: Any) -> tuple[Any, str | None]: